@@ -92,6 +92,7 @@ _config_dict["PATHS"]["LOGS_DIR"] = os.path.join(
 _config_dict["LOGGING"] = {
     "LEVEL": os.environ.get("LOG_LEVEL", "INFO"),
     "FILE": os.path.join(_config_dict["PATHS"]["DATA_DIR"], "logs", "backend.log"),
+    "RICH_TRACEBACKS": True,  # Rich-rendered tracebacks on the terminal (reads source; slower)
 }
 
 
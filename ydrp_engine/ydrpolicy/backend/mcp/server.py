@@ -18,12 +18,12 @@ from mcp.server.fastmcp import FastMCP
 
 # No longer need SseServerTransport directly
 # from mcp.server.sse import SseServerTransport
-from rich.logging import RichHandler
 
 from ydrpolicy.backend.config import config
 from ydrpolicy.backend.database.engine import get_async_session
 from ydrpolicy.backend.database.repository.policies import PolicyRepository
 from ydrpolicy.backend.services.embeddings import embed_text
+from ydrpolicy.logging_setup import CONSOLE_HANDLER_NAME
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -163,16 +163,17 @@ def start_mcp_server(host: str, port: int, transport: str):
     if transport == "stdio":
         logger.info("Configuring logger for stdio mode (disabling console handler)...")
         root_logger = logging.getLogger()
-        rich_handler_found = False
+        console_handler_found = False
+        # Match by name: the console handler is a RichHandler on a TTY but a plain StreamHandler when piped
         for h in root_logger.handlers[:]:
-            if isinstance(h, RichHandler):
+            if h.get_name() == CONSOLE_HANDLER_NAME:
                 root_logger.removeHandler(h)
-                rich_handler_found = True
-                logger.info(f"Removed RichHandler: {h}")
-        if rich_handler_found:
+                console_handler_found = True
+                logger.info(f"Removed console handler: {h}")
+        if console_handler_found:
             logger.info("Console logging disabled for stdio mode.")
         else:
-            logger.warning("Could not find RichHandler to remove for stdio mode.")
+            logger.warning("Could not find console handler to remove for stdio mode.")
 
     try:
         if transport == "stdio":
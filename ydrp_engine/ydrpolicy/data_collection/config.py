@@ -27,6 +27,13 @@ _config_dict["PATHS"]["TXT_DIR"] = os.path.join(
     _config_dict["PATHS"]["DATA_DIR"], "TXT"
 )
 _config_dict["PATHS"]["SOURCE_POLICIES_DIR"] = os.path.join(_BASE_DIR, "data", "source_policies")
+_config_dict["PATHS"]["EXTRACTION_CACHE_DIR"] = os.path.join(
+    _config_dict["PATHS"]["DATA_DIR"], "extraction_cache"
+)
+# Reuse cached PDF -> markdown extractions keyed by PDF content; set False to always re-extract
+_config_dict["PATHS"]["USE_EXTRACTION_CACHE"] = True
+# Hardlink unchanged files (e.g. policy images) instead of copying; set False for independent copies
+_config_dict["PATHS"]["USE_HARDLINKS"] = True
 
 
 # Convert nested dictionaries to SimpleNamespace objects recursively
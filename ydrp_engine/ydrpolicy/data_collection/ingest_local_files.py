@@ -7,7 +7,7 @@ from ydrpolicy.data_collection.config import config as data_config
 from pypdf import PdfReader
 import pymupdf  # PyMuPDF
 from ydrpolicy.data_collection.processors.pdf_processor import (
-    extract_pdf_markdown_with_links,
+    extract_pdf_markdown_with_links_cached,
 )
 
 
@@ -32,22 +32,37 @@ def _write_processed_txt(pdf_path: str, processed_dir: str) -> Optional[str]:
     txt_path = os.path.join(processed_dir, f"{base}.txt")
     try:
         # Prefer PyMuPDF to preserve hyperlinks; serialize links inline as [text](url)
-        text_with_links = extract_pdf_markdown_with_links(pdf_path)
+        text_with_links = extract_pdf_markdown_with_links_cached(pdf_path, data_config)
         normalized = _normalize_text_no_blank_lines(text_with_links)
         with open(txt_path, "w", encoding="utf-8") as f:
             f.write(normalized)
         return txt_path
     except Exception as mupdf_err:
         logger.warning(f"PyMuPDF failed for '{pdf_path}', falling back to PyPDF: {mupdf_err}")
+        tmp_path = f"{txt_path}.tmp"
         try:
             reader = PdfReader(pdf_path)
-            pieces = [page.extract_text() or "" for page in reader.pages]
-            normalized = _normalize_text_no_blank_lines("\n".join(pieces))
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(normalized)
+            # Write page by page so only one page's text is held in memory at a time.
+            # Write to a temp file and swap it in on success so an earlier good TXT survives failures.
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                wrote_any = False
+                for page in reader.pages:
+                    page_text = _normalize_text_no_blank_lines(page.extract_text() or "")
+                    if not page_text:
+                        continue
+                    if wrote_any:
+                        f.write("\n")
+                    f.write(page_text)
+                    wrote_any = True
+            os.replace(tmp_path, txt_path)
             return txt_path
         except Exception as e:
             logger.error(f"Failed to extract text from PDF '{pdf_path}': {e}")
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             return None
 
 
@@ -1,10 +1,12 @@
 # ydrpolicy/data_collection/process_local_pdfs.py
 
+import csv
+import io
 import logging
 import os
 import re
 import shutil
-from typing import Optional
+from typing import Any, Iterator, Optional, TextIO
 
 from ydrpolicy.data_collection.config import config as data_config
 from ydrpolicy.data_collection.processors.pdf_processor import pdf_file_to_markdown
@@ -16,6 +18,27 @@ from ydrpolicy.data_collection.utils.markdown_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Columns of processed_policies_log.csv
+_CSV_LOG_HEADER = [
+    "url",
+    "file_path",
+    "include",
+    "found_links_count",
+    "definite_links",
+    "probable_links",
+    "timestamp",
+    "contains_policy",
+    "policy_title",
+    "policy_content_path",
+    "extraction_reasoning",
+]
+
+# Underscores/hyphens in filenames become spaces in titles
+_TITLE_SEPARATOR_PATTERN = re.compile(r"[_\-]+")
+
+# Dated source folders look like policies_YYYYMMDD
+_POLICIES_DIR_PATTERN = re.compile(r"^policies_(\d{8})$")
+
 
 def _find_latest_policies_dir(base_dir: str) -> Optional[str]:
     if not os.path.isdir(base_dir):
@@ -23,24 +46,41 @@ def _find_latest_policies_dir(base_dir: str) -> Optional[str]:
         return None
     latest_dir: Optional[str] = None
     latest_key: Optional[int] = None
-    pattern = re.compile(r"^policies_(\d{8})$")
-    for name in os.listdir(base_dir):
-        full = os.path.join(base_dir, name)
-        if not os.path.isdir(full):
-            continue
-        m = pattern.match(name)
-        if not m:
-            continue
-        try:
+    # DirEntry.is_dir() uses the cached d_type, so only symlinks need an extra stat
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            m = _POLICIES_DIR_PATTERN.match(entry.name)
+            if not m:
+                continue
             key = int(m.group(1))
-        except ValueError:
-            continue
-        if latest_key is None or key > latest_key:
-            latest_key = key
-            latest_dir = full
+            if latest_key is None or key > latest_key:
+                latest_key = key
+                latest_dir = entry.path
     return latest_dir
 
 
+def _iter_pdf_paths(root_dir: str) -> Iterator[str]:
+    """Yield PDF paths under root_dir as they are found (like os.walk, symlinked dirs are not descended)."""
+    pending = [root_dir]
+    while pending:
+        dir_path = pending.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError as e:
+            # Like os.walk, skip unreadable directories instead of aborting the whole run
+            logger.warning(f"Could not scan directory {dir_path}: {e}")
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        pending.append(entry.path)
+                elif entry.name.lower().endswith(".pdf"):
+                    yield entry.path
+
+
 def process_all_local_pdfs(
     source_policies_root: Optional[str] = None, global_download_url: Optional[str] = None
 ) -> None:
@@ -61,36 +101,29 @@ def process_all_local_pdfs(
     csv_log_path = os.path.join(
         data_config.PATHS.PROCESSED_DATA_DIR, "processed_policies_log.csv"
     )
-    csv_header = (
-        "url,file_path,include,found_links_count,definite_links,probable_links,timestamp,"
-        "contains_policy,policy_title,policy_content_path,extraction_reasoning\n"
-    )
-    if not os.path.exists(csv_log_path):
-        try:
-            with open(csv_log_path, "w", encoding="utf-8") as f:
-                f.write(csv_header)
-        except Exception as e:
-            logger.warning(f"Could not create CSV log at {csv_log_path}: {e}")
 
     processed_count = 0
     skipped_count = 0
     error_count = 0
 
-    for dirpath, _, filenames in os.walk(root_dir):
-        for filename in filenames:
-            if not filename.lower().endswith(".pdf"):
-                continue
-            pdf_path = os.path.join(dirpath, filename)
+    # One buffered handle for the whole run instead of an open/close per PDF
+    csv_file = _open_csv_log(csv_log_path)
+    try:
+        csv_writer = _csv_log_writer(csv_file) if csv_file else None
+        for pdf_path in _iter_pdf_paths(root_dir):
             ok = _process_single_pdf(
                 pdf_path=pdf_path,
                 global_download_url=global_download_url,
-                csv_log_path=csv_log_path,
+                csv_writer=csv_writer,
                 local_policies_dir=local_policies_dir,
             )
             if ok:
                 processed_count += 1
             else:
                 skipped_count += 1
+    finally:
+        if csv_file:
+            csv_file.close()
 
     logger.info(
         f"Local PDF processing finished. Processed: {processed_count}, Skipped: {skipped_count}, Errors: {error_count}"
@@ -104,28 +137,40 @@ def process_one_pdf(pdf_path: str, global_download_url: Optional[str] = None) ->
     csv_log_path = os.path.join(
         data_config.PATHS.PROCESSED_DATA_DIR, "processed_policies_log.csv"
     )
-    if not os.path.exists(csv_log_path):
-        csv_header = (
-            "url,file_path,include,found_links_count,definite_links,probable_links,timestamp,"
-            "contains_policy,policy_title,policy_content_path,extraction_reasoning\n"
+    csv_file = _open_csv_log(csv_log_path)
+    try:
+        return _process_single_pdf(
+            pdf_path=pdf_path,
+            global_download_url=global_download_url,
+            csv_writer=_csv_log_writer(csv_file) if csv_file else None,
+            local_policies_dir=local_policies_dir,
         )
-        try:
-            with open(csv_log_path, "w", encoding="utf-8") as f:
-                f.write(csv_header)
-        except Exception as e:
-            logger.warning(f"Could not create CSV log at {csv_log_path}: {e}")
-    return _process_single_pdf(
-        pdf_path=pdf_path,
-        global_download_url=global_download_url,
-        csv_log_path=csv_log_path,
-        local_policies_dir=local_policies_dir,
-    )
+    finally:
+        if csv_file:
+            csv_file.close()
+
+
+def _open_csv_log(csv_log_path: str) -> Optional[TextIO]:
+    """Open processed_policies_log.csv for appending, writing the header if the file is new."""
+    try:
+        f = open(csv_log_path, "a", encoding="utf-8", newline="", buffering=1 << 16)
+    except OSError as e:
+        logger.warning(f"Could not open CSV log at {csv_log_path}: {e}")
+        return None
+    if f.tell() == 0:
+        _csv_log_writer(f).writerow(_CSV_LOG_HEADER)
+    return f
+
+
+def _csv_log_writer(f: TextIO) -> Any:
+    """CSV writer for processed_policies_log.csv using LF line endings (csv defaults to CRLF)."""
+    return csv.writer(f, lineterminator="\n")
 
 
 def _process_single_pdf(
     pdf_path: str,
     global_download_url: Optional[str],
-    csv_log_path: str,
+    csv_writer: Optional[Any],
     local_policies_dir: str,
 ) -> bool:
     try:
@@ -135,16 +180,17 @@ def _process_single_pdf(
         title_pretty = _prettify_title_from_filename(pdf_path)
         md_output_dir = data_config.PATHS.MARKDOWN_DIR
         os.makedirs(md_output_dir, exist_ok=True)
-        md_path, raw_timestamp = pdf_file_to_markdown(pdf_path, md_output_dir, data_config)
-        if not md_path or not os.path.exists(md_path) or not raw_timestamp:
+        md_path, raw_timestamp, md_text = pdf_file_to_markdown(pdf_path, md_output_dir, data_config)
+        if not md_path or md_text is None or not raw_timestamp:
             logger.warning(f"OCR/Markdown conversion failed for PDF. Skipping: {pdf_path}")
             return False
 
         scrape_timestamp = raw_timestamp
         try:
-            with open(md_path, "r", encoding="utf-8") as f_md:
-                raw_md_content = f_md.readlines()
-            text_content = _filter_markdown_for_txt(raw_md_content)
+            # Work from the returned text rather than re-reading the file just written. Universal-newline
+            # StringIO splits exactly like reading the file did (\n, \r\n and \r become \n, nothing else splits).
+            md_lines = io.StringIO(md_text, newline=None).readlines()
+            text_content = _filter_markdown_for_txt(md_lines)
             header_lines = [
                 f"# Source URL: {global_download_url or ''}",
                 f"# Imported From: Local PDF",
@@ -152,7 +198,7 @@ def _process_single_pdf(
                 f"# Timestamp: {scrape_timestamp}",
                 "\n---\n\n",
             ]
-            markdown_content = "".join(header_lines) + "".join(raw_md_content)
+            markdown_content = "".join(header_lines) + "".join(md_lines)
         except Exception as e:
             logger.error(f"Failed to prepare markdown/text for '{pdf_path}': {e}")
             return False
@@ -170,16 +216,17 @@ def _process_single_pdf(
             source_img_dir = os.path.join(md_output_dir, scrape_timestamp)
             if os.path.isdir(source_img_dir):
                 copied = 0
-                for item in os.listdir(source_img_dir):
-                    s = os.path.join(source_img_dir, item)
-                    d = os.path.join(dest_folder, item)
-                    if os.path.isfile(s):
+                # scandir's DirEntry caches the file type, avoiding a stat per image
+                with os.scandir(source_img_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_file():
+                            continue
                         try:
-                            shutil.copy2(s, d)
+                            _link_or_copy(entry.path, os.path.join(dest_folder, entry.name))
                             copied += 1
                         except Exception as img_err:
                             logger.warning(
-                                f"Failed to copy image '{item}' for '{title_pretty}': {img_err}"
+                                f"Failed to copy image '{entry.name}' for '{title_pretty}': {img_err}"
                             )
                 if copied:
                     logger.info(
@@ -189,33 +236,50 @@ def _process_single_pdf(
             logger.error(f"Failed to write structured files for '{title_pretty}': {e}")
             return False
 
-        try:
-            url_field = (global_download_url or "").strip()
-            file_basename = os.path.basename(dest_md_path)
-            include = True
-            found_links_count = 0
-            definite_links = "[]"
-            probable_links = "[]"
-            timestamp_field = scrape_timestamp
-            contains_policy = True
-            policy_title_field = title_pretty
-            policy_content_path = dest_md_path
-            reasoning_field = "Imported from local PDFs"
-            row = f'{url_field},{file_basename},{str(include)},{found_links_count},"{definite_links}","{probable_links}",{timestamp_field},{str(contains_policy)},{policy_title_field},{policy_content_path},{reasoning_field}\n'
-            with open(csv_log_path, "a", encoding="utf-8") as f:
-                f.write(row)
-        except Exception as log_err:
-            logger.warning(f"Failed to append to processed_policies_log.csv: {log_err}")
+        if csv_writer is not None:
+            try:
+                csv_writer.writerow(
+                    [
+                        (global_download_url or "").strip(),  # url
+                        os.path.basename(dest_md_path),  # file_path
+                        True,  # include
+                        0,  # found_links_count
+                        "[]",  # definite_links
+                        "[]",  # probable_links
+                        scrape_timestamp,  # timestamp
+                        True,  # contains_policy
+                        title_pretty,  # policy_title
+                        dest_md_path,  # policy_content_path
+                        "Imported from local PDFs",  # extraction_reasoning
+                    ]
+                )
+            except Exception as log_err:
+                logger.warning(f"Failed to append to processed_policies_log.csv: {log_err}")
         return True
     except Exception as e:
         logger.error(f"Unexpected error processing PDF '{pdf_path}': {e}")
         return False
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst when PATHS.USE_HARDLINKS is set, else (or on failure) copy the bytes."""
+    if data_config.PATHS.USE_HARDLINKS:
+        try:
+            os.link(src, dst)
+            return
+        except FileExistsError:
+            if os.path.samefile(src, dst):
+                return
+        except OSError:
+            # e.g. different filesystems or a filesystem without hardlink support
+            pass
+    shutil.copyfile(src, dst)
+
+
 def _prettify_title_from_filename(name: str) -> str:
     base = os.path.splitext(os.path.basename(name))[0]
-    pretty = re.sub(r"[_\-]+", " ", base).strip()
-    pretty = re.sub(r"\s+", " ", pretty)
+    # split()/join collapses and trims whitespace without a second regex pass
+    pretty = " ".join(_TITLE_SEPARATOR_PATTERN.sub(" ", base).split())
     return pretty or base
 
 
@@ -24,6 +24,15 @@ from ydrpolicy.data_collection.processors.pdf_processor import (
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Read size used when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Yale document repository URLs carry the document UUID in the path
+YALE_DOCUMENT_PATTERN = re.compile(r"/documents/([a-f0-9-]+)")
+
+# Shared session so consecutive downloads reuse pooled connections (no new TCP/TLS handshake per file)
+_http_session = requests.Session()
+
 
 def download_document(url: str, output_dir: str, config: SimpleNamespace) -> str:
     """
@@ -44,7 +53,7 @@ def download_document(url: str, output_dir: str, config: SimpleNamespace) -> str
     # For Yale document repository URLs with UUIDs
     if "files-profile.medicine.yale.edu/documents/" in url:
         # Extract UUID as filename
-        match = re.search(r"/documents/([a-f0-9-]+)", parsed_url.path)
+        match = YALE_DOCUMENT_PATTERN.search(parsed_url.path)
         if match:
             filename = f"yale_doc_{match.group(1)}.pdf"  # Assume PDF for Yale documents
         else:
@@ -77,30 +86,32 @@ def download_document(url: str, output_dir: str, config: SimpleNamespace) -> str
             "Cache-Control": "max-age=0",
         }
 
-        response = requests.get(
+        # Stream the body straight to disk so memory stays bounded by the chunk size,
+        # and release the connection as soon as the download completes.
+        with _http_session.get(
             url, stream=True, timeout=config.CRAWLER.REQUEST_TIMEOUT, headers=headers
-        )
-        response.raise_for_status()
-
-        # Check content type to confirm it's a document
-        content_type = response.headers.get("Content-Type", "").lower()
-        is_document = (
-            "pdf" in content_type
-            or "msword" in content_type
-            or "application/vnd.openxmlformats" in content_type
-            or "application/vnd.ms-excel" in content_type
-            or "application/octet-stream" in content_type
-        )
-
-        if not is_document:
-            logger.warning(
-                f"Content type '{content_type}' may not be a document for {url}"
+        ) as response:
+            response.raise_for_status()
+
+            # Check content type to confirm it's a document
+            content_type = response.headers.get("Content-Type", "").lower()
+            is_document = (
+                "pdf" in content_type
+                or "msword" in content_type
+                or "application/vnd.openxmlformats" in content_type
+                or "application/vnd.ms-excel" in content_type
+                or "application/octet-stream" in content_type
             )
-            # Continue anyway - some servers don't set correct content types
 
-        with open(file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            if not is_document:
+                logger.warning(
+                    f"Content type '{content_type}' may not be a document for {url}"
+                )
+                # Continue anyway - some servers don't set correct content types
+
+            with open(file_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
 
         logger.info(f"Document downloaded successfully to {file_path}")
         return file_path
@@ -3,7 +3,9 @@ Module for handling LLM interactions for content analysis and OCR.
 """
 
 import os
+import re
 import json
+import threading
 from types import SimpleNamespace
 from typing import Dict, Optional, Union, List
 from openai import OpenAI
@@ -18,12 +20,33 @@ from ydrpolicy.data_collection.processors import llm_prompts
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Cheap pre-filter: content without any of these terms is not worth an LLM call
+POLICY_SIGNAL_PATTERN = re.compile(
+    r"polic(?:y|ies)|guideline|protocol|procedur|regulation|compliance", re.IGNORECASE
+)
+
+
+# Lazily created client shared across calls so HTTP connections are kept alive
+_openai_client: Optional[OpenAI] = None
+_openai_client_lock = threading.Lock()
+
+
+def _get_openai_client(config: SimpleNamespace) -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use or when the API key changes."""
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None or _openai_client.api_key != config.LLM.OPENAI_API_KEY:
+            _openai_client = OpenAI(api_key=config.LLM.OPENAI_API_KEY)
+        return _openai_client
+
 
 class PolicyContent(BaseModel):
     """Pydantic model for structured policy content extraction."""
 
-    include: bool = Field(description="Whether the content contains policy information")
-    content: str = Field(description="The extracted policy content")
+    include: bool = Field(
+        default=False, description="Whether the content contains policy information"
+    )
+    content: str = Field(default="", description="The extracted policy content")
     definite_links: List[str] = Field(
         default_factory=list,
         description="Links that definitely contain policy information",
@@ -40,7 +63,11 @@ def process_document_with_ocr(document_url: str, config: SimpleNamespace) -> str
 
 
 def analyze_content_for_policies(
-    content: str, url: str, links: list = None, config: SimpleNamespace = None
+    content: str,
+    url: str,
+    links: list = None,
+    config: SimpleNamespace = None,
+    depth: int = 0,
 ) -> Dict[str, Union[bool, str, list]]:
     """
     Analyze content using LLM to detect policy information and relevant links.
@@ -49,11 +76,28 @@ def analyze_content_for_policies(
         content: The content to analyze
         url: The source URL of the content
         links: List of links from the page (optional)
+        depth: Crawl depth of the page; pages below the root (depth > 0) without policy keywords skip the LLM
 
     Returns:
         Dictionary with 'include', 'content', 'definite_links', and 'probable_links' keys
     """
     try:
+        # Skip the LLM round-trip for non-root pages when neither the content nor the link texts carry
+        # any policy signal; seed/root pages are always analyzed so their links are still classified
+        link_texts = " ".join(link_text or "" for _, link_text in links or [])
+        if (
+            depth > 0
+            and not POLICY_SIGNAL_PATTERN.search(content)
+            and not POLICY_SIGNAL_PATTERN.search(link_texts)
+        ):
+            logger.info(f"No policy keywords found, skipping LLM analysis for: {url}")
+            return {
+                "include": False,
+                "content": "",
+                "definite_links": [],
+                "probable_links": [],
+            }
+
         if not config.LLM.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is not set in the environment variables")
 
@@ -61,12 +105,12 @@ def analyze_content_for_policies(
 
         # Add links information to the prompt if available
         links_info = ""
-        if links and len(links) > 0:
-            links_info = "\n\nLinks found on the page:\n"
-            for i, (link_url, link_text) in enumerate(
-                links[:50]
-            ):  # Limit to 50 links to avoid token limits
-                links_info += f"{i+1}. [{link_text}]({link_url})\n"
+        if links:
+            # Limit to 50 links to avoid token limits; build the block in one join
+            links_info = "\n\nLinks found on the page:\n" + "".join(
+                f"{i}. [{link_text}]({link_url})\n"
+                for i, (link_url, link_text) in enumerate(links[:50], start=1)
+            )
 
         # Prepare messages
         messages = [
@@ -83,7 +127,7 @@ def analyze_content_for_policies(
 
         try:
             # Get completion from LLM with proper Pydantic model
-            openai_client = OpenAI(api_key=config.LLM.OPENAI_API_KEY)
+            openai_client = _get_openai_client(config)
             response = openai_client.chat.completions.create(
                 model=config.LLM.CRAWLER_LLM_MODEL,
                 messages=messages,
@@ -93,16 +137,8 @@ def analyze_content_for_policies(
             # Process the response
             if hasattr(response, "choices") and len(response.choices) > 0:
                 result_text = response.choices[0].message.content
-                # Parse the JSON manually first
-                result_dict = json.loads(result_text)
-
-                # Then create a PolicyContent object from it
-                policy_content = PolicyContent(
-                    include=result_dict.get("include", False),
-                    content=result_dict.get("content", ""),
-                    definite_links=result_dict.get("definite_links", []),
-                    probable_links=result_dict.get("probable_links", []),
-                )
+                # Parse and validate in one pass; missing keys fall back to the model defaults
+                policy_content = PolicyContent.model_validate_json(result_text)
 
                 # Convert to dictionary
                 result = policy_content.model_dump()
@@ -115,7 +151,7 @@ def analyze_content_for_policies(
             logger.warning(f"Error parsing LLM response: {str(parsing_error)}")
             # Try direct JSON approach as fallback
             try:
-                openai_client = OpenAI(api_key=config.LLM.OPENAI_API_KEY)
+                openai_client = _get_openai_client(config)
                 response = openai_client.chat.completions.create(
                     model=config.LLM.CRAWLER_LLM_MODEL,
                     messages=messages,
@@ -1,19 +1,33 @@
 # ydrpolicy/data_collection/processors/pdf_processor.py
 
 import os
-import base64
+import re
 import uuid
+import hashlib
 import logging
 import datetime
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 from typing import Tuple, Optional
 
 from pypdf import PdfReader
 import pymupdf  # PyMuPDF
 
+# Prefer the SIMD-accelerated pybase64 when installed; it is a drop-in for the stdlib module
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
 logger = logging.getLogger(__name__)
 
+# OCR image placeholders look like ![img-0.jpeg](img-0.jpeg)
+_IMAGE_PLACEHOLDER_PATTERN = re.compile(r"!\[([^\]]+)\]\(([^)]+)\)")
+
+# Part of the extraction cache key; bump when extractor output changes so stale entries are ignored
+_EXTRACTOR_VERSION = 1
+
 
 def generate_pdf_raw_timestamp_name() -> Tuple[str, str]:
     now = datetime.datetime.now()
@@ -22,6 +36,27 @@ def generate_pdf_raw_timestamp_name() -> Tuple[str, str]:
     return timestamp_basename, markdown_filename
 
 
+def _pdf_content_hash(pdf_path: str) -> str:
+    """Return the SHA-256 hex digest of a file's bytes, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _store_in_extraction_cache(text: str, cache_path: str) -> None:
+    """Write extracted markdown into the cache via temp file + atomic rename."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not store extraction cache entry {cache_path}: {e}")
+
+
 def pdf_url_to_markdown(
     pdf_url: str, output_folder: str, config: SimpleNamespace
 ) -> Tuple[Optional[str], Optional[str]]:
@@ -32,8 +67,8 @@ def pdf_url_to_markdown(
 
 def pdf_file_to_markdown(
     pdf_path: str, output_folder: str, config: SimpleNamespace
-) -> Tuple[Optional[str], Optional[str]]:
-    """Extract text from a local PDF to markdown via PyPDF; returns (md_path, timestamp)."""
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Extract text from a local PDF to markdown via PyPDF; returns (md_path, timestamp, md_text)."""
     markdown_path: Optional[str] = None
     timestamp_basename: Optional[str] = None
     doc_images_dir: Optional[str] = None
@@ -47,7 +82,7 @@ def pdf_file_to_markdown(
                 # Do not include any header here; ingestion step will add a unified header.
                 file.write(text)
             logger.info(f"Local PDF -> MD via PyMuPDF success: {markdown_path}")
-            return markdown_path, timestamp_basename
+            return markdown_path, timestamp_basename, text
         except Exception as mupdf_err:
             logger.error(f"PyMuPDF extraction failed, falling back to PyPDF: {mupdf_err}")
             try:
@@ -59,7 +94,7 @@ def pdf_file_to_markdown(
                 with open(markdown_path, "w", encoding="utf-8") as file:
                     file.write(text)
                 logger.info(f"Local PDF -> MD via PyPDF fallback success: {markdown_path}")
-                return markdown_path, timestamp_basename
+                return markdown_path, timestamp_basename, text
             except Exception as pypdf_err:
                 logger.error(f"PyPDF fallback extraction failed: {pypdf_err}")
                 raise
@@ -76,18 +111,12 @@ def pdf_file_to_markdown(
                 shutil.rmtree(doc_images_dir)
             except OSError:
                 pass
-        return None, None
+        return None, None, None
 
 
 def save_base64_image(
     base64_str: str, output_dir: str, img_name: str = None
 ) -> Optional[str]:
-    if not os.path.exists(output_dir):
-        try:
-            os.makedirs(output_dir)
-        except OSError as e:
-            logger.error(f"Failed create dir {output_dir}: {e}")
-            return None
     if img_name is None:
         img_name = f"image_{uuid.uuid4().hex[:8]}.png"
     elif not any(
@@ -95,48 +124,75 @@ def save_base64_image(
         for ext in [".png", ".jpg", ".jpeg", ".gif", ".bmp"]
     ):
         img_name += ".png"
-    if "," in base64_str:
-        try:
-            _, encoded_data = base64_str.split(",", 1)
-            base64_str = encoded_data
-        except ValueError:
-            logger.warning(f"Comma found but couldn't split prefix {img_name}.")
+    # Strip a data-URL prefix ("data:image/png;base64,"); only the head is inspected
+    if base64_str.startswith("data:"):
+        comma = base64_str.find(",", 0, 128)
+        if comma >= 0:
+            base64_str = base64_str[comma + 1 :]
+        else:
+            logger.warning(f"Data-URL prefix found but no comma in header {img_name}.")
     img_path = os.path.join(output_dir, img_name)
     try:
-        img_data = base64.b64decode(base64_str, validate=True)
-        with open(img_path, "wb") as img_file:
+        # Hand the decoder ASCII bytes directly so it does not re-encode the str internally
+        payload = base64_str.encode("ascii") if isinstance(base64_str, str) else base64_str
+        img_data = _b64.b64decode(payload, validate=True)
+        try:
+            img_file = open(img_path, "wb")
+        except FileNotFoundError:
+            # The directory is normally created by the caller; create it only when it is missing
+            os.makedirs(output_dir, exist_ok=True)
+            img_file = open(img_path, "wb")
+        with img_file:
             img_file.write(img_data)
-        logger.debug(f"Saved image {img_name} to {img_path}")
+        logger.debug("Saved image %s to %s", img_name, img_path)
         return img_path
     except Exception as e:
         logger.error(f"Image save error {img_name}: {e}")
         return None
 
 
-def get_combined_markdown(ocr_response, doc_images_dir: str) -> str:
-    markdowns = []
-    page_num = 1
+def write_combined_markdown(
+    ocr_response, doc_images_dir: str, markdown_path: str
+) -> Optional[str]:
+    """Stream every OCR page (with image links rewritten) to markdown_path; returns the path or None."""
     if not hasattr(ocr_response, "pages") or not ocr_response.pages:
         logger.warning("OCR response missing pages.")
-        return ""
+        return None
+    # Collect every embedded image up front so decoding and writing can run in parallel
+    image_data = {}
     for page in ocr_response.pages:
-        image_data = {}
         if hasattr(page, "images") and page.images:
             for img in page.images:
                 if hasattr(img, "id") and hasattr(img, "image_base64"):
                     image_data[img.id] = img.image_base64
-        page_markdown = getattr(page, "markdown", "")
-        # Replace placeholders with saved image links
-        for img_id, b64 in image_data.items():
-            filename = f"{img_id}.png"
-            saved = save_base64_image(b64, doc_images_dir, filename)
-            if saved:
-                page_markdown = page_markdown.replace(
-                    f"![{img_id}]({img_id})", f"![{img_id}]({filename})"
-                )
-        markdowns.append(page_markdown)
-        page_num += 1
-    return "\n\n---\n\n".join(markdowns)
+    saved_ids = set()
+    if image_data:
+        os.makedirs(doc_images_dir, exist_ok=True)
+        # Per-image decode + write both release the GIL, so a short-lived thread pool overlaps them
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix="pdf-img") as pool:
+            results = pool.map(
+                lambda item: save_base64_image(item[1], doc_images_dir, f"{item[0]}.png"),
+                image_data.items(),
+            )
+            saved_ids = {img_id for img_id, saved in zip(image_data, results) if saved}
+
+    def _link_saved_image(match: re.Match) -> str:
+        img_id, target = match.group(1), match.group(2)
+        if img_id == target and img_id in saved_ids:
+            return f"![{img_id}]({img_id}.png)"
+        return match.group(0)
+
+    # Write page by page so only one page's markdown is held in memory at a time
+    with open(markdown_path, "w", encoding="utf-8", buffering=1 << 20) as file:
+        for page_index, page in enumerate(ocr_response.pages):
+            # Replace ![id](id) placeholders with saved image links in a single pass
+            page_markdown = _IMAGE_PLACEHOLDER_PATTERN.sub(
+                _link_saved_image, getattr(page, "markdown", "")
+            )
+            if page_index:
+                file.write("\n\n---\n\n")
+            file.write(page_markdown)
+    return markdown_path
 
 
 def extract_pdf_markdown_with_links(pdf_path: str) -> str:
@@ -151,6 +207,39 @@ def extract_pdf_markdown_with_links(pdf_path: str) -> str:
     Returns:
         Markdown-flavored text with [text](URL) where applicable.
     """
+    return _extract_pdf_markdown_with_links(pdf_path)[0]
+
+
+def extract_pdf_markdown_with_links_cached(pdf_path: str, config: SimpleNamespace) -> str:
+    """
+    Same as extract_pdf_markdown_with_links, reusing earlier results for identical PDF bytes.
+
+    Entries live in PATHS.EXTRACTION_CACHE_DIR as v{_EXTRACTOR_VERSION}-<sha256>.md. Output from
+    a degraded extraction (OCR unavailable or a page fell back to plain text) is not cached, so
+    it is redone once OCR works. Set PATHS.USE_EXTRACTION_CACHE to False to always re-extract.
+    """
+    if not config.PATHS.USE_EXTRACTION_CACHE:
+        return extract_pdf_markdown_with_links(pdf_path)
+    cache_path = os.path.join(
+        config.PATHS.EXTRACTION_CACHE_DIR,
+        f"v{_EXTRACTOR_VERSION}-{_pdf_content_hash(pdf_path)}.md",
+    )
+    if os.path.isfile(cache_path):
+        with open(cache_path, "r", encoding="utf-8", newline="") as cached:
+            logger.info(f"PDF text served from extraction cache: {pdf_path}")
+            return cached.read()
+    text, complete = _extract_pdf_markdown_with_links(pdf_path)
+    if complete:
+        _store_in_extraction_cache(text, cache_path)
+    return text
+
+
+def _extract_pdf_markdown_with_links(pdf_path: str) -> Tuple[str, bool]:
+    """Extract as in extract_pdf_markdown_with_links; returns (text, complete).
+
+    complete is False when OCR was unavailable or a page fell back to plain text.
+    """
+    complete = True
     try:
         lines_out = []
         with pymupdf.open(pdf_path) as doc:
@@ -180,6 +269,7 @@ def extract_pdf_markdown_with_links(pdf_path: str) -> str:
                             continue
                         except Exception:
                             # Fall back to simple text if OCR unavailable
+                            complete = False
                             text_plain = page.get_text("text") or ""
                             for raw_line in (text_plain.splitlines() if text_plain else []):
                                 lines_out.append(raw_line)
@@ -261,19 +351,20 @@ def extract_pdf_markdown_with_links(pdf_path: str) -> str:
                             # Replace the last page's lines (best-effort): append OCR text as new page section
                             lines_out.append(ocr_text)
                         except Exception:
-                            pass
+                            complete = False
 
                     # Page separator blank line
                     lines_out.append("")
                 except Exception as page_err:
                     logger.warning(f"Failed to extract page {page.number}: {page_err}")
+                    complete = False
                     text_plain = page.get_text("text") or ""
                     if text_plain:
                         lines_out.extend(text_plain.splitlines())
                         lines_out.append("")
 
         result = "\n".join(lines_out).strip()
-        return result
+        return result, complete
     except Exception as e:
         logger.error(f"PyMuPDF hyperlink-aware extraction failed for '{pdf_path}': {e}")
         raise
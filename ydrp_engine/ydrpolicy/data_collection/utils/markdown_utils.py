@@ -1,6 +1,22 @@
 import re
 from typing import List
 
+# Filename sanitization patterns
+_NON_WORD_PATTERN = re.compile(r"[^\w\-]+")
+_UNDERSCORE_RUN_PATTERN = re.compile(r"_+")
+
+# Lines starting with these are navigation/metadata, not content
+_SKIP_PREFIXES = (
+    "* ",
+    "+ ",
+    "- ",
+    "[",  # also covers link-only lines such as "[text](url)"
+    "# Content from URL:",
+    "# Final Accessed URL:",
+    "# Retrieved at:",
+)
+_NAV_LINES = frozenset(("MENU", "Back to Top"))
+
 
 def sanitize_filename(name: str, max_len: int = 80) -> str:
     """
@@ -15,8 +31,8 @@ def sanitize_filename(name: str, max_len: int = 80) -> str:
     """
     if not name:
         return "untitled_policy"
-    sanitized = re.sub(r"[^\w\-]+", "_", name)
-    sanitized = re.sub(r"_+", "_", sanitized).strip("_-")
+    sanitized = _NON_WORD_PATTERN.sub("_", name)
+    sanitized = _UNDERSCORE_RUN_PATTERN.sub("_", sanitized).strip("_-")
     sanitized = sanitized[:max_len]
     return sanitized or "untitled_policy"
 
@@ -34,28 +50,15 @@ def filter_markdown_for_txt(markdown_lines: List[str]) -> str:
         A single string containing filtered text content.
     """
     filtered_lines: List[str] = []
-    skip_prefixes = (
-        "* ",
-        "+ ",
-        "- ",
-        "[",
-        "# Content from URL:",
-        "# Final Accessed URL:",
-        "# Retrieved at:",
-    )
-    link_only_pattern = re.compile(r"^\s*\[.*\]\(.*\)\s*$")
-
     for line in markdown_lines:
         stripped = line.strip()
         if not stripped:
             continue
-        if stripped.startswith(skip_prefixes):
-            continue
-        if link_only_pattern.match(stripped):
+        if stripped.startswith(_SKIP_PREFIXES):
             continue
-        if stripped in ("MENU", "Back to Top"):
+        if stripped in _NAV_LINES:
             continue
-        if stripped.count("/") > 2 and stripped.startswith("/"):
+        if stripped.startswith("/") and stripped.count("/") > 2:
             continue
         filtered_lines.append(line)
 
@@ -6,10 +6,13 @@ This module provides a single function `setup_logging` to configure
 the standard Python logging system based on application configuration
 and command-line flags.
 """
+import atexit
 import logging
 import os
+import queue
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
 
 # Import Rich library components for console handling
 from rich.console import Console
@@ -30,6 +33,24 @@ except ImportError as e:
     )
     sys.exit(1)  # Exit if config cannot be loaded, as logging setup is fundamental
 
+# Name given to the root console handler so callers (e.g. MCP stdio mode) can find and remove it
+CONSOLE_HANDLER_NAME = "ydrpolicy.console"
+
+# Background listeners that own the real file handlers (see _add_file_handler)
+_queue_listeners: List[QueueListener] = []
+
+
+def _stop_queue_listeners() -> None:
+    """Flush and stop any background log listeners started by setup_logging, closing their file handlers."""
+    while _queue_listeners:
+        listener = _queue_listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(_stop_queue_listeners)
+
 
 def setup_logging(
     log_level_str: Optional[str] = None,
@@ -48,17 +69,22 @@ def setup_logging(
     after command-line arguments (like --no-log or --log-level) are processed.
 
     Sets up handlers for console and separate files for backend and data collection.
+    File handlers run on background QueueListener threads so logging calls never block on disk I/O.
 
     Args:
         log_level_str: The desired logging level (e.g., "INFO", "DEBUG").
                        Defaults to backend config level if None.
         disable_logging: If True, disables all logging handlers globally.
-        log_to_console: If True, adds a console handler (RichHandler) to the root logger.
+        log_to_console: If True, adds a console handler to the root logger (RichHandler when
+                        stderr is a terminal, a plain StreamHandler otherwise).
         backend_log_file: Path for the backend file log. Defaults to backend config.
         dc_log_file_crawler: Path for the data collection crawler file log. Defaults to data collection config.
         dc_log_file_scraper: Path for the data collection scraper file log. Defaults to data collection config.
         dc_log_file_collect: Path for the combined data collection file log (optional).
     """
+    # Drop listeners from any earlier call before handlers are rebuilt
+    _stop_queue_listeners()
+
     # --- Global Disable Check ---
     if disable_logging:
         # Configure root logger with NullHandler to silence everything, preventing
@@ -66,6 +92,9 @@ def setup_logging(
         logging.basicConfig(
             level=logging.CRITICAL + 1, force=True, handlers=[logging.NullHandler()]
         )
+        # Drop queue handlers from an earlier call; their listeners are stopped, so nothing would drain them
+        for name in ("ydrpolicy.backend", "ydrpolicy.data_collection"):
+            logging.getLogger(name).handlers.clear()
         # A direct print indicates why no logs will appear.
         print("NOTICE: Logging setup skipped as logging is disabled.", file=sys.stderr)
         return  # Stop setup
@@ -90,20 +119,28 @@ def setup_logging(
     # List to gather status messages for final log entry
     init_messages = [f"Logging configured. Level: {effective_level_str.upper()}"]
 
-    # --- Console Handler (Rich) - Added to Root Logger ---
+    # --- Console Handler (Rich on a terminal, plain otherwise) - Added to Root Logger ---
     if log_to_console:
-        # Create a RichHandler for pretty console output (sent to stderr)
-        rich_handler = RichHandler(
-            rich_tracebacks=True,
-            console=Console(stderr=True),  # Ensure logs go to stderr
-            show_time=True,
-            show_path=False,
-            log_time_format="[%X]",  # e.g., [14:30:59]
-        )
-        rich_handler.setLevel(log_level)
+        if sys.stderr.isatty():
+            # Create a RichHandler for pretty console output (sent to stderr)
+            console_handler = RichHandler(
+                rich_tracebacks=backend_config.LOGGING.RICH_TRACEBACKS,
+                console=Console(stderr=True),  # Ensure logs go to stderr
+                show_time=True,
+                show_path=False,
+                log_time_format="[%X]",  # e.g., [14:30:59]
+            )
+            console_mode = "rich"
+        else:
+            # Piped/CI output: skip Rich markup and highlighting, keep lines grep-friendly
+            console_handler = logging.StreamHandler(sys.stderr)
+            console_handler.setFormatter(file_formatter)
+            console_mode = "plain"
+        console_handler.setLevel(log_level)
+        console_handler.set_name(CONSOLE_HANDLER_NAME)
         # Add the console handler to the root logger
-        root_logger.addHandler(rich_handler)
-        init_messages.append("Console logging: ON")
+        root_logger.addHandler(console_handler)
+        init_messages.append(f"Console logging: ON ({console_mode})")
     else:
         init_messages.append("Console logging: OFF")
 
@@ -128,8 +165,15 @@ def setup_logging(
                 )
                 file_handler.setFormatter(file_formatter)
                 file_handler.setLevel(log_level)
-                # Add the handler to the specific logger instance
-                logger_instance.addHandler(file_handler)
+                # Writes happen on a listener thread; logging calls only enqueue the record
+                log_queue: queue.Queue = queue.Queue(-1)
+                listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+                listener.start()
+                _queue_listeners.append(listener)
+                queue_handler = QueueHandler(log_queue)
+                queue_handler.setLevel(log_level)
+                # Add the queueing handler to the specific logger instance
+                logger_instance.addHandler(queue_handler)
                 init_messages.append(f"{file_desc} File logging: ON ({file_path})")
             except Exception as e:
                 # Print error directly as logger setup might be failing